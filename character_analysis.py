@@ -11,6 +11,42 @@ from data_cleaning import data_cleaning, final_reshape, sort_names
 
 ABSOLUTE_MAX_TOKENS = 4096
 DEFAULT_ATTRIBUTES = ["Characters", "Settings"]
+ANALYSIS_INSTRUCTIONS = (
+  'You are a developmental editor helping create a story bible. \n'
+  'Be detailed but concise, using short phrases instead of sentences. Do not '
+  'justify your reasoning or provide commentary, only facts. Only one attribute '
+  'per line, just like in the schema below, but all description for that '
+  'attribute should be on the same line. If something appears to be '
+  'miscatagorized, please put it under the correct attribute. USE ONLY STRINGS '
+  'AND JSON OBJECTS, NO JSON ARRAYS. The output must be valid JSON.\n'
+  'If you cannot find any mention of something in the text, please '
+  'respond with "None found" as the description for that attribute. \n'
+)
+CHARACTER_INSTRUCTIONS = (
+  'For each character in the chapter, describe their appearance, personality, '
+  'mood, relationships to other characters, known or apparent sexuality.\n'
+  'An example from an early chapter of Jane Eyre:\n'
+  '"Jane Eyre": {"Appearance": "Average height, slender build, fair skin, '
+  'dark brown hair, hazel eyes, plain apearance", "Personality": "Reserved, '
+  'self-reliant, modest", "Mood": "Angry at her aunt about her treatment while '
+  'at Gateshead", "Sexuality": "None found}'
+)
+SETTING_INSTRUCTIONS = (
+  'For each setting in the chapter, note how the setting is described, where '
+  'it is in relation to other locations and whether the characters appear to be '
+  'familiar or unfamiliar with the location. Be detailed but concise.\n'
+  'If you are unsure of a setting or no setting is shown in the text, please '
+  'respond with "None found" as the description for that setting.\n'
+  'Here is an example from Wuthering Heights:\n'
+  '"Moors": {"Appearance": Expansive, desolate, rugged, with high winds and '
+  'cragy rocks", "Relative location": "Surrounds Wuthering Heights estate", '
+  '"Main character\'s familiarity": "Very familiar, Catherine spent significant '
+  'time roaming here as a child and represents freedom to her"}'
+)
+SCHEMA_INSTRUCTIONS = (
+  'You will format this information as a JSON object using the folllowing schema '
+  'where "description" is replaced with the actual information.\n'
+)
 
 def initialize_names(chapters: list, folder_name: str) -> Tuple[int, list, int, dict, int, list, int]:
 
@@ -182,44 +218,13 @@ def character_analysis_role_script(attribute_table: dict, chapter_number: str) -
 
   def create_instructions(to_batch: list) -> str:
 
-    instructions = (
-      'You are a developmental editor helping create a story bible. \n'
-      'Be detailed but concise, using short phrases instead of sentences. Do not '
-      'justify your reasoning or provide commentary, only facts. Only one attribute '
-      'per line, just like in the schema below, but all description for that '
-      'attribute should be on the same line. If something appears to be '
-      'miscatagorized, please put it under the correct attribute. USE ONLY STRINGS '
-      'AND JSON OBJECTS, NO JSON ARRAYS. The output must be valid JSON.\n'
-      'If you cannot find any mention of something in the text, please '
-      'respond with "None found" as the description for that attribute. \n'
-    )
-    character_instructions = (
-      'For each character in the chapter, describe their appearance, personality, '
-      'mood, relationships to other characters, known or apparent sexuality.\n'
-      'An example from an early chapter of Jane Eyre:\n'
-      '"Jane Eyre": {"Appearance": "Average height, slender build, fair skin, '
-      'dark brown hair, hazel eyes, plain apearance", "Personality": "Reserved, '
-      'self-reliant, modest", "Mood": "Angry at her aunt about her treatment while '
-      'at Gateshead", "Sexuality": "None found}'
-    )
-    setting_instructions = (
-      'For each setting in the chapter, note how the setting is described, where '
-      'it is in relation to other locations and whether the characters appear to be '
-      'familiar or unfamiliar with the location. Be detailed but concise.\n'
-      'If you are unsure of a setting or no setting is shown in the text, please '
-      'respond with "None found" as the description for that setting.\n'
-      'Here is an example from Wuthering Heights:\n'
-      '"Moors": {"Appearance": Expansive, desolate, rugged, with high winds and '
-      'cragy rocks", "Relative location": "Surrounds Wuthering Heights estate", '
-      '"Main character\'s familiarity": "Very familiar, Catherine spent significant '
-      'time roaming here as a child and represents freedom to her"}'
-    )
+    instructions = ANALYSIS_INSTRUCTIONS
 
     for attribute in to_batch:
       if attribute == "Characters":
-        instructions += character_instructions
+        instructions += CHARACTER_INSTRUCTIONS
       if attribute == "Settings":
-        instructions += setting_instructions
+        instructions += SETTING_INSTRUCTIONS
       else:
         other_attribute_list = [attr for attr in to_batch
                               if attr not in DEFAULT_ATTRIBUTES]
@@ -228,10 +233,7 @@ def character_analysis_role_script(attribute_table: dict, chapter_number: str) -
           ', '.join(other_attribute_list) +
           ' without referencing specific characters or plot points\n')
 
-    instructions += (
-      'You will format this information as a JSON object using the folllowing schema '
-      'where "description" is replaced with the actual information.\n'
-    )
+    instructions += SCHEMA_INSTRUCTIONS
     return instructions
 
   def form_schema(to_batch: list) -> str:
@@ -261,7 +263,6 @@ def character_analysis_role_script(attribute_table: dict, chapter_number: str) -
   for attribute, attribute_names in chapter_data.items():
     token_value = tokens_per.get(attribute, tokens_per["Other"])
     token_count = min(len(attribute_names) * token_value, ABSOLUTE_MAX_TOKENS)
-    instructions =  create_instructions(to_batch)
     if max_tokens + token_count > ABSOLUTE_MAX_TOKENS:
       instructions =  create_instructions(to_batch)
       attributes_batch = append_attributes_batch(
@@ -352,11 +353,8 @@ def summarize_attributes(chapter_summaries: dict, folder_name: str, summaries: l
       summary = cf.call_gpt_api(model_key, prompt, role_script, temperature, max_tokens)
       summaries.append(summary)
       chapter_summaries[attribute][attribute_name]["summary"] = summary
-      cf.append_json_file(summary, summaries_path)
-      if os.path.exists(with_summaries_path):
-        cf.append_json_file(chapter_summaries[attribute][attribute_name], with_summaries_path)
-      else:
-        cf.write_json_file(chapter_summaries, with_summaries_path)
+      cf.write_json_file(summaries, summaries_path)
+      cf.write_json_file(chapter_summaries, with_summaries_path)
       progress_bar.update(1)
 
   return chapter_summaries
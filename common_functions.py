@@ -8,6 +8,10 @@ from typing import Any, Optional
 import openai
 import tiktoken
 from openai import OpenAI
+try:
+  import orjson
+except ImportError:
+  orjson = None
 
 from data_cleaning import check_json, merge_json_halves
 from error_handler import ErrorHandler
@@ -30,6 +34,31 @@ if not api_key:
   ErrorHandler.kill_app("OPENAI_API_KEY environment variable not set")
 
 OPENAI_CLIENT = OpenAI()
+TOKENIZER = tiktoken.get_encoding("cl100k_base")
+CONTINUE_PROMPT = "Please continue from the exact point you left off without any commentary"
+CONTINUE_PROMPT_TOKENS = len(TOKENIZER.encode(CONTINUE_PROMPT))
+UNRESOLVABLE_ERRORS = (
+  openai.BadRequestError,
+  openai.AuthenticationError,
+  openai.NotFoundError,
+  openai.PermissionDeniedError,
+  openai.UnprocessableEntityError
+)
+MAX_RETRIES = 5
+RETRY_BACKOFF = tuple((MAX_RETRIES - count) + count ** 2 for count in range(MAX_RETRIES))
+MODEL_DETAILS = {
+  "gpt_three": {
+    "model_name": "gpt-3.5-turbo-1106",
+    "rate_limit": 90000,
+    "context_window": 16000
+  },
+  "gpt_four": {
+    "model_name": "gpt-4-1106-preview",
+    "rate_limit": 300000,
+    "context_window": 128000
+  }
+}
+DEFAULT_MODEL_DETAILS = {"model_name": None, "rate_limit": 250000, "context_window": 4096}
 
 def append_to_dict_list(dictionary, key, value):
   "Appends value to list of values in dictionary"
@@ -63,8 +92,8 @@ def read_json_file(file_path: str):
   "Opens and reads JSON file"
 
   try:
-    with open(file_path, "r") as f:
-      read_file = json.load(f)
+    with open(file_path, "rb") as f:
+      read_file = orjson.loads(f.read()) if orjson else json.load(f)
     return read_file
   except Exception as e:
     ErrorHandler.kill_app(e)
@@ -83,6 +112,10 @@ def separate_into_chapters(text: str) -> list:
 def write_json_file(content, file_path: str):
   "Writes JSON file"
 
+  if orjson:
+    with open(file_path, "wb") as f:
+      f.write(orjson.dumps(content, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    return
   with open(file_path, "w") as f:
     json.dump(content, f, indent=2)
 
@@ -127,19 +160,7 @@ def get_model_details(model_key: str) -> dict:
   Interprets the generic model key and returns model-specific details.
   """
   
-  model_details = {
-    "gpt_three": {
-      "model_name": "gpt-3.5-turbo-1106",
-      "rate_limit": 90000,
-      "context_window": 16000
-    },
-    "gpt_four": {
-      "model_name": "gpt-4-1106-preview",
-      "rate_limit": 300000,
-      "context_window": 128000
-    }
-  }
-  return model_details.get(model_key, {"model_name": None, "rate_limit": 250000, "context_window": 4096})
+  return MODEL_DETAILS.get(model_key, DEFAULT_MODEL_DETAILS)
 
 def is_rate_limit(model_key: str) -> int:
   """
@@ -150,8 +171,7 @@ def is_rate_limit(model_key: str) -> int:
 
 def count_tokens(text):
   "Counts tokens using OpenAI's tiktoken tokenizer"
-  tokenizer = tiktoken.get_encoding("cl100k_base")
-  return len(tokenizer.encode(text))
+  return len(TOKENIZER.encode(text))
 
 def error_handle(e: Any, retry_count: int) -> int:
   """
@@ -167,19 +187,11 @@ def error_handle(e: Any, retry_count: int) -> int:
     retry_count: the number of attemps so far
   """
 
-  unresolvable_errors = [
-    openai.BadRequestError,
-    openai.AuthenticationError,
-    openai.NotFoundError,
-    openai.PermissionDeniedError,
-    openai.UnprocessableEntityError
-  ]
-
   error_code = getattr(e, "status_code", None)
   error_details = getattr(e, "response", {}).json().get("error", {})
   error_message = error_details.get("message", "Unknown error")
 
-  if isinstance(e, tuple(unresolvable_errors)):
+  if isinstance(e, UNRESOLVABLE_ERRORS):
     ErrorHandler.kill_app(e)
   if error_code == 401:
     ErrorHandler.kill_app(e)
@@ -188,10 +200,10 @@ def error_handle(e: Any, retry_count: int) -> int:
 
   logging.exception(e)
   retry_count += 1
-  if retry_count == 5:
+  if retry_count == MAX_RETRIES:
     ErrorHandler.kill_app("Maximum retry count reached")
   else:
-    sleep_time = (5 - retry_count)  + (retry_count ** 2)
+    sleep_time = RETRY_BACKOFF[retry_count]
     logging.warning(f"Retry attempt #{retry_count} in {sleep_time} seconds.")
     time.sleep(sleep_time)
   return retry_count
@@ -221,7 +233,7 @@ def call_gpt_api(model_key: str, prompt: str, role_script: str, temperature: flo
     rate_limit_data["minute"] = time.time()
   model_details = get_model_details(model_key)
   model_name = model_details["model_name"]
-  rate_limit = is_rate_limit(model_key)
+  rate_limit = model_details["rate_limit"]
   input_tokens = count_tokens(prompt) + count_tokens(role_script)
   
   messages = [
@@ -229,16 +241,15 @@ def call_gpt_api(model_key: str, prompt: str, role_script: str, temperature: flo
       {"role": "user", "content": prompt}
   ]
   if assistant_message:
-    added_prompt = "Please continue from the exact point you left off without any commentary"
     messages.append({
       "role": "assistant",
       "content": assistant_message
     })
     messages.append({
       "role": "user",
-      "content": added_prompt
+      "content": CONTINUE_PROMPT
     })
-    assistant_length = count_tokens(assistant_message) + count_tokens(added_prompt)
+    assistant_length = count_tokens(assistant_message) + CONTINUE_PROMPT_TOKENS
     input_tokens += assistant_length
 
   if response_type == "json":
@@ -259,7 +270,7 @@ def call_gpt_api(model_key: str, prompt: str, role_script: str, temperature: flo
   response_format = {"type": "json_object"} if response_type == "json" else {"type": "text"}
 
   try:
-    api_start = time.time()
+    api_start = time.monotonic()
     response = OPENAI_CLIENT.chat.completions.create(
       model = model_name,
       messages = messages,
@@ -267,7 +278,7 @@ def call_gpt_api(model_key: str, prompt: str, role_script: str, temperature: flo
       max_tokens = max_tokens,
       response_format = response_format
     )
-    api_end = time.time()
+    api_end = time.monotonic()
     api_run = api_end - api_start
     api_minute = api_run // 60
     api_sec = api_run % 60
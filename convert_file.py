@@ -31,6 +31,7 @@ NOT_CHAPTER = [
   "question", "rear", "revision", "sign up", "table", "toc", "volume",
   "warning"
 ]
+OCR_SESSION = requests.Session()
 
 def roman_to_int(roman: str) -> int:
   """
@@ -205,7 +206,7 @@ def run_ocr(base64_images: list) -> str:
     "max_tokens": 10
   }
   try:
-    response = requests.post(
+    response = OCR_SESSION.post(
         "https://api.openai.com/v1/chat/completions",
         headers=headers,
         json=payload
@@ -1,16 +1,22 @@
 import json
 import os
 import re
+import sys
 import time
+from functools import lru_cache
 from typing import Optional, Tuple
 
 from json_repair import repair_json
+try:
+  from orjson import loads as json_loads
+except ImportError:
+  from json import loads as json_loads
 
 import common_functions as cf
 from error_handler import ErrorHandler
 
 
-TITLES = [
+TITLES = {
   "admiral", "airman", "ambassador", "aunt", "baron", "baroness", "brother", "cadet",
   "cap", "captain", "col", "colonel", "commander", "commodore", "corporal", "count",
   "countess", "cousin", "dad", "daddy", "doc", "doctor", "dr", "duchess", "duke",
@@ -22,7 +28,9 @@ TITLES = [
   "mjr", "mom", "mommy", "mother", "mr", "mrs", "ms", "nurse", "pa", "pfc", "pop",
   "prince", "princess", "private", "queen", "sarge", "seaman", "sergeant", "sir",
   "sister", "uncle"
-  ]
+  }
+BRACE_PATTERN = re.compile(r"[{}]")
+NARRATOR_PATTERN = re.compile("the main character|main character|narrator|protagonist")
 
 def compare_names(inner_values: list, name_map: dict) -> list:
 
@@ -61,7 +69,7 @@ def sort_names(character_lists: list, narrator: str) -> dict:
   missing_newline_between_pattern = re.compile(r"(\w+ \(\w+\))\s+(\w+)")
   missing_newline_after_pattern = re.compile(r"(?<=\w):\s*(?=\w)")
   junk_lines = ["additional", "note", "none"]
-  stop_words = ["mentioned", "unknown", "he", "they", "she", "we", "it", "boy", "girl", "main", "him", "her", "I", "</s>", "a"]
+  stop_words = {"mentioned", "unknown", "he", "they", "she", "we", "it", "boy", "girl", "main", "him", "her", "i", "</s>", "a"}
 
   for chapter_index, proto_dict in character_lists:
     if chapter_index not in parse_tuples:
@@ -113,7 +121,7 @@ def sort_names(character_lists: list, narrator: str) -> dict:
       if line == "":
         i += 1
         continue
-      if line.lower() in [word.lower() for word in stop_words]:
+      if line.lower() in stop_words:
           i += 1
           continue
       if any(junk in line.lower() for junk in junk_lines):
@@ -193,17 +201,15 @@ def final_reshape(chapter_summaries: dict, folder_name: str) -> None:
     if attribute not in ["Characters", "Settings"]:
       reshaped_data[attribute] = names
       continue
-    reshaped_data[attribute] = {}
+    attribute_dict = reshaped_data[attribute] = {}
     for name, chapters in names.items():
-      reshaped_data[attribute][name] = {}
+      name_dict = attribute_dict[name] = {}
       for chapter, traits in chapters.items():
         if not isinstance(traits, dict):
-          reshaped_data[attribute][name][chapter] = traits
+          name_dict[chapter] = traits
           continue
         for trait, detail in traits.items():
-          if trait not in reshaped_data[attribute][name]:
-            reshaped_data[attribute][name][trait] = {}
-          reshaped_data[attribute][name][trait][chapter] = detail
+          name_dict.setdefault(trait, {})[chapter] = detail
   cf.write_json_file(reshaped_data, os.path.join(folder_name, "lorebinder.json"))
 
 def sort_dictionary(attribute_summaries: dict) -> dict:
@@ -215,8 +221,8 @@ def sort_dictionary(attribute_summaries: dict) -> dict:
     middle_dict = {key: nested_dict[key] for key in sorted(nested_dict)}
     for key, inner_dict in middle_dict.items():
       if isinstance(inner_dict, dict):
-        sorted_inner_dict = {str(inner_key): inner_dict[str(inner_key)]
-                            for inner_key in sorted(map(int, inner_dict.keys()))}
+        sorted_inner_dict = {inner_key: inner_dict[inner_key]
+                            for inner_key in sorted(inner_dict, key = int)}
         middle_dict[key] = sorted_inner_dict
     sorted_dict[outer_key] = middle_dict
 
@@ -228,10 +234,8 @@ def clean_narrator(original_dict: dict, narrator_name) -> dict:
   narrator_list = ["narrator", "protagonist", "the main character", "main character"]
 
   def iterate_narrator_list(value):
-    for narrator in narrator_list:
-      new_value = value.replace(narrator, narrator_name)
-    return new_value
-  
+    return NARRATOR_PATTERN.sub(lambda _: narrator_name, value)
+
   new_dict = {}
   for key, value in original_dict.items():
     if key in narrator_list:
@@ -247,6 +251,7 @@ def clean_narrator(original_dict: dict, narrator_name) -> dict:
   return new_dict
 
 
+@lru_cache(maxsize=None)
 def to_singular(plural: str) -> str:
   """
   Converts a plural word to its singular form based on common English pluralization rules.
@@ -340,6 +345,7 @@ def deduplicate_across_dictionaries(attribute_summaries: dict) -> dict:
 
   return attribute_summaries
 
+@lru_cache(maxsize=None)
 def remove_titles(key: str) -> str:
   "Removes words in TITLES list from key"
 
@@ -348,7 +354,7 @@ def remove_titles(key: str) -> str:
   return " ".join(de_titled)
 
 def is_title(key: str) -> bool:
-  return any(title == key.lower() for title in TITLES)
+  return key.lower() in TITLES
 
 def prioritize_keys(key1: str, key2: str) -> Tuple[str, str]:
   "Determines priority of keys, based on whether one is standalone title or length"
@@ -416,7 +422,7 @@ def deduplicate_keys(dictionary:dict) -> dict:
   for outer_key, nested_dict in dictionary.items():
     if not isinstance(nested_dict, dict):
       continue
-    duplicate_keys = []
+    duplicate_keys = set()
     inner_dict = {}
 
     for key1 in nested_dict:
@@ -429,7 +435,7 @@ def deduplicate_keys(dictionary:dict) -> dict:
           key_to_merge, key_to_keep = prioritize_keys(key1, key2)
           nested_dict[key_to_keep] = merge_values(nested_dict[key_to_keep],
                                                   nested_dict[key_to_merge])
-          duplicate_keys.append(key_to_merge)
+          duplicate_keys.add(key_to_merge)
 
     for key, value in nested_dict.items():
       if key in duplicate_keys:
@@ -453,28 +459,36 @@ def reshape_dict(chapter_summaries: dict) -> dict:
 
   for chapter, chapter_data in chapter_summaries.items():
     for section, section_data in chapter_data.items():
-      section = section.title()
-      if section not in reshaped_data:
-        reshaped_data[section] = {}
+      section_dict = reshaped_data.setdefault(sys.intern(section.title()), {})
       for entity, entity_details in section_data.items():
+        entity = sys.intern(entity)
         if isinstance(entity_details, dict):
+          if not entity_details:
+            continue
+          chapter_dict = section_dict.setdefault(entity, {}).setdefault(chapter, {})
           for key, value in entity_details.items():
-            reshaped_data[section].setdefault(entity, {}).setdefault(chapter, {}).setdefault(key, []).append(value)
+            chapter_dict.setdefault(sys.intern(key), []).append(value)
         elif isinstance(entity_details, str):
-          reshaped_data[section].setdefault(entity, {}).setdefault(chapter, []).append(entity_details)
+          section_dict.setdefault(entity, {}).setdefault(chapter, []).append(entity_details)
   return reshaped_data
 
 def find_full_object(string: str, forward: bool = True) -> int:
   "Finds the position of the first full object of a string representation"
-  " of a partial JSON object"
+  " of a partial JSON object. Searching backward, the position is counted"
+  " from the end of the string"
 
   balanced = 0 if forward else -1
+  last = len(string) - 1
   count = 0
-  for i, char in enumerate(string):
-    if char == "{":
+  braces = BRACE_PATTERN.finditer(string)
+  if not forward:
+    braces = reversed(list(braces))
+  for brace in braces:
+    if brace.group() == "{":
       count += 1
-    elif char == "}":
+    else:
       count -= 1
+      i = brace.start() if forward else last - brace.start()
       if i != 0 and count == balanced:
         return i
   return 0
@@ -492,7 +506,7 @@ def merge_json_halves(first_half: str, second_half: str) -> Optional[str]:
 
   repair_log = "repair_log.txt"
   repair_stub = f"{time.time()}\nFirst response:\n{first_half}\nSecond response:\n{second_half}"
-  first_end = find_full_object(first_half[::-1], forward = False)
+  first_end = find_full_object(first_half, forward = False)
   second_start = find_full_object(second_half)
   if first_end and second_start:
     first_end = len(first_half) - first_end - 1
@@ -505,7 +519,7 @@ def merge_json_halves(first_half: str, second_half: str) -> Optional[str]:
     return None
 
   try:
-    return json.loads(combined_str)
+    return json_loads(combined_str)
   except json.JSONDecodeError:
     log = f"Did not properly repair.\n{repair_stub}\nCombined is:\n{combined_str}"
     return None
@@ -634,7 +648,7 @@ def check_json_stub(json_lines: list, start: int, end: int, reverse: bool = Fals
   for i in range(start, end, -1 if reverse else 1):
     partial_str = "".join(json_lines[i:] if reverse else json_lines[:i])
     try:
-      json.loads(partial_str)
+      json_loads(partial_str)
       return i, partial_str
     except json.JSONDecodeError:
       continue
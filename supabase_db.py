@@ -2,7 +2,7 @@ import os
 
 from dotenv import load_dotenv
 from supabase import create_client, Client
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 
 
 load_dotenv()
@@ -22,12 +22,13 @@ class SupabaseDatabase:
       query = query.eq(key, value)
     query.update(data).execute()
 
-  def insert_data(self, table: str, data: Dict[str, Any]) -> None:
+  def insert_data(self, table: str, data: Union[Dict[str, Any], List[Dict[str, Any]]]) -> None:
+    "Inserts one row, or a list of rows in a single request"
     self.supabase.table(table).insert(data).execute()
 
   def check_existing(self, table: str, criteria: Dict[str, Any]) -> bool:
     query = self.supabase.table(table).select("id")
     for key, value in criteria.items():
       query = query.filter(key, 'eq', value)
-    result = query.execute().data
+    result = query.limit(1).execute().data
     return len(result) > 0